@@ -22,7 +22,7 @@ class Command(BaseCommand):
             start = start_index
             end = start_index + chunk_size
 
-            shares = BackpackBadgeShare.objects.order_by('id')[start:end]
+            shares = BackpackBadgeShare.objects.select_related('badgeinstance').order_by('id')[start:end]
             for share in shares:
                 self.stdout.write("Processing shares %s" % processing_index)
                 event = badgrlog.BadgeSharedEvent(share.badgeinstance, share.provider, share.created_at, share.source)
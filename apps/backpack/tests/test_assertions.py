@@ -9,8 +9,7 @@ import responses
 import mock
 from django.db import IntegrityError
 from django.urls import reverse
-from openbadges.verifier.openbadges_context import (OPENBADGES_CONTEXT_V2_URI, OPENBADGES_CONTEXT_V1_URI,
-                                                    OPENBADGES_CONTEXT_V2_DICT)
+from openbadges.verifier.openbadges_context import OPENBADGES_CONTEXT_V2_URI, OPENBADGES_CONTEXT_V1_URI
 from openbadges_bakery import bake, unbake
 
 from backpack.models import BackpackBadgeShare
@@ -18,7 +17,8 @@ from badgeuser.models import CachedEmailAddress, UserRecipientIdentifier
 from issuer.models import BadgeClass, Issuer, BadgeInstance
 from mainsite.tests.base import BadgrTestCase, SetupIssuerHelper
 from mainsite.utils import first_node_match, OriginSetting
-from .utils import setup_basic_0_5_0, setup_basic_1_0, setup_basic_1_0_bad_image, setup_resources, CURRENT_DIRECTORY
+from .utils import setup_basic_0_5_0, setup_basic_1_0, setup_basic_1_0_bad_image, setup_resources, CURRENT_DIRECTORY, \
+    OPENBADGES_CONTEXT_V2_JSON
 
 
 class TestShareProviders(SetupIssuerHelper, BadgrTestCase):
@@ -79,7 +79,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_1_0()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', token_scope='rw:backpack')
 
@@ -145,7 +145,7 @@ class TestBadgeUploads(BadgrTestCase):
 
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
 
         self.setup_user(email='test@example.com', token_scope='rw:backpack')
@@ -178,7 +178,7 @@ class TestBadgeUploads(BadgrTestCase):
         self.setup_user(email='test@example.com', token_scope='rw:backpack')
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
 
         post_input = {
@@ -200,7 +200,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_1_0()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='not.test@email.example.com', authenticate=True)
 
@@ -224,7 +224,7 @@ class TestBadgeUploads(BadgrTestCase):
         self.setup_user(email='test@example.com', authenticate=True)
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
 
         responses.add(
@@ -254,7 +254,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_1_0()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -322,7 +322,7 @@ class TestBadgeUploads(BadgrTestCase):
 
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)},
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON},
             {'url': "https://openbadgespec.org/extensions/exampleExtension/context.json",
                 'response_body': json.dumps(
                     {
@@ -397,7 +397,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_1_0()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -425,7 +425,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_1_0()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -452,7 +452,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_resources([
             {'url': 'http://a.com/instance3', 'filename': '1_0_basic_instance3.json'},
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -491,7 +491,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_1_0(**{'exclude': ['http://a.com/badgeclass_image']})
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -514,7 +514,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_1_0(**{'exclude': ['http://a.com/issuer']})
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -544,7 +544,7 @@ class TestBadgeUploads(BadgrTestCase):
         )
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
 
         post_input = {
@@ -569,7 +569,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_0_5_0()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -592,7 +592,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_0_5_0()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -614,7 +614,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_resources([
             {'url': 'http://a.com/instance2', 'filename': '1_0_basic_instance2.json'},
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -667,7 +667,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_resources([
             {'url': 'http://a.com/instancebaddate', 'filename': '1_0_basic_instance_with_bad_date.json'},
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -693,7 +693,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_resources([
             {'url': 'http://a.com/issuer', 'filename': '1_0_basic_issuer_invalid_json.json'},
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -717,7 +717,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_resources([
             {'url': 'http://a.com/instance', 'filename': '1_0_basic_issuer_invalid_json.json'},
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -741,7 +741,7 @@ class TestBadgeUploads(BadgrTestCase):
     def test_submit_badges_with_intragraph_references(self):
         setup_resources([
             {'url': 'http://a.com/assertion-embedded1', 'filename': '2_0_assertion_embedded_badgeclass.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)},
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON},
             {'url': 'http://a.com/badgeclass_image', 'filename': "unbaked_image.png", 'mode': 'rb'},
         ])
         self.setup_user(email='test@example.com', authenticate=True)
@@ -765,7 +765,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_1_0()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', token_scope='rw:backpack')
 
@@ -806,7 +806,7 @@ class TestBadgeUploads(BadgrTestCase):
         setup_basic_1_0_bad_image()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', token_scope='rw:backpack')
 
@@ -860,7 +860,7 @@ class TestDeleteLocalAssertion(BadgrTestCase, SetupIssuerHelper):
 
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)},
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON},
             {'url': assertion.jsonld_id, 'response_body': json.dumps(assertion.get_json())},
             {
                 'url': assertion.jsonld_id + '/image',
@@ -905,7 +905,7 @@ class TestDeleteLocalAssertion(BadgrTestCase, SetupIssuerHelper):
         issuer_data = """{"@context":"https://w3id.org/openbadges/v2","type":"Issuer","id":"https://gist.githubusercontent.com/badgebotio/456issuer789/raw","name":"BadgeBot","url":"https://badgebot.io"}"""  # noqa: E501
 
         setup_resources([
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)},
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON},
             {'url': json.loads(assertion_data)['id'], 'response_body': assertion_data},
             {'url': json.loads(badgeclass_data)['id'], 'response_body': badgeclass_data},
             {
@@ -1098,7 +1098,7 @@ class TestPendingBadges(BadgrTestCase, SetupIssuerHelper):
             {'url': 'http://a.com/assertion-embedded1',
                 'filename': '2_0_assertion_embedded_badgeclass.json'},
             {'url': OPENBADGES_CONTEXT_V2_URI,
-                'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)},
+                'response_body': OPENBADGES_CONTEXT_V2_JSON},
             {'url': 'http://a.com/badgeclass_image',
                 'filename': "unbaked_image.png", 'mode': 'rb'},
         ])
@@ -1149,7 +1149,7 @@ class TestPendingBadges(BadgrTestCase, SetupIssuerHelper):
             {'url': 'http://a.com/assertion-embedded1',
                 'filename': '2_0_assertion_embedded_badgeclass.json'},
             {'url': OPENBADGES_CONTEXT_V2_URI,
-                'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)},
+                'response_body': OPENBADGES_CONTEXT_V2_JSON},
             {'url': 'http://a.com/badgeclass_image',
                 'filename': "unbaked_image.png", 'mode': 'rb'},
         ])
@@ -8,7 +8,7 @@ import string
 import shutil
 from urllib import parse
 
-from openbadges.verifier.openbadges_context import OPENBADGES_CONTEXT_V2_URI, OPENBADGES_CONTEXT_V2_DICT
+from openbadges.verifier.openbadges_context import OPENBADGES_CONTEXT_V2_URI
 import responses
 import mock
 
@@ -17,7 +17,7 @@ from django.core.files.storage import default_storage
 from django.utils.encoding import force_text
 from rest_framework.fields import DateTimeField
 
-from backpack.tests.utils import setup_resources
+from backpack.tests.utils import setup_resources, OPENBADGES_CONTEXT_V2_JSON
 from mainsite.models import BadgrApp
 from mainsite.tests import BadgrTestCase, SetupIssuerHelper
 from mainsite.utils import fetch_remote_file_to_storage
@@ -225,7 +225,7 @@ class BadgeConnectOAuthTests(BadgrTestCase, SetupIssuerHelper):
         REMOTE_BADGE_URI = 'http://a.com/assertion-embedded1'
         setup_resources([
             {'url': REMOTE_BADGE_URI, 'filename': '2_0_assertion_embedded_badgeclass.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)},
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON},
             {'url': 'http://a.com/badgeclass_image', 'filename': "unbaked_image.png", 'mode': 'rb'},
         ])
         # Post new external assertion
@@ -544,7 +544,7 @@ class BadgeConnectAPITests(BadgrTestCase, SetupIssuerHelper):
     def test_submit_badges_with_intragraph_references(self):
         setup_resources([
             {'url': 'http://a.com/assertion-embedded1', 'filename': '2_0_assertion_embedded_badgeclass.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)},
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON},
             {'url': 'http://a.com/badgeclass_image', 'filename': "unbaked_image.png", 'mode': 'rb'},
         ])
         self.setup_user(email='test@example.com', authenticate=True)
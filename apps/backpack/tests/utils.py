@@ -1,8 +1,13 @@
+import json
 import os
 import responses
+from openbadges.verifier.openbadges_context import OPENBADGES_CONTEXT_V2_DICT
 
 CURRENT_DIRECTORY = os.path.dirname(__file__)
 
+# the v2 context document is served by many mocked responses; encode it once
+OPENBADGES_CONTEXT_V2_JSON = json.dumps(OPENBADGES_CONTEXT_V2_DICT)
+
 
 def setup_basic_1_0(**kwargs):
     if not kwargs or 'http://a.com/instance' not in kwargs.get('exclude', []):
@@ -5,7 +5,7 @@ from django.http import Http404
 from django.views.generic import RedirectView
 
 from backpack.models import BackpackCollection
-from issuer.models import BadgeInstance, BadgeClass
+from issuer.models import BadgeInstance
 from badgeuser.models import BadgeUser
 
 from rest_framework.decorators import (
@@ -302,15 +302,10 @@ def add_issuerImage(first_page_content, issuerImage):
 def pdf(request, *args, **kwargs):
     slug = kwargs["slug"]
     try:
-        badgeinstance = BadgeInstance.objects.get(entity_id=slug)
+        badgeinstance = BadgeInstance.objects.select_related('badgeclass__issuer', 'issuer').get(entity_id=slug)
     except BadgeInstance.DoesNotExist:
         raise Http404
-    try:
-        badgeclass = BadgeClass.objects.get(
-            entity_id=badgeinstance.badgeclass.entity_id
-        )
-    except BadgeClass.DoesNotExist:
-        raise Http404
+    badgeclass = badgeinstance.badgeclass
 
     try: 
         badgeuser = BadgeUser.objects.get(email=badgeinstance.recipient_identifier)  
@@ -6,8 +6,6 @@ import urllib.parse
 import urllib.error
 import urllib.parse
 
-import requests
-
 from allauth.account.adapter import get_adapter
 from allauth.account.models import EmailConfirmationHMAC
 from allauth.account.utils import user_pk_to_url_str, url_str_to_user_pk
@@ -26,16 +24,15 @@ from django.contrib.sites.shortcuts import get_current_site
 from django.core.cache import cache
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.urls import reverse
-from django.http import Http404, JsonResponse
+from django.http import Http404
 from django.utils import timezone
 from django.views.generic import RedirectView
-from django.conf import settings
 from rest_framework import permissions, serializers, status
 from rest_framework.exceptions import ValidationError as RestframeworkValidationError
 from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
 from rest_framework.status import (HTTP_302_FOUND, HTTP_200_OK, HTTP_404_NOT_FOUND,
-        HTTP_201_CREATED, HTTP_400_BAD_REQUEST, HTTP_409_CONFLICT)
+        HTTP_201_CREATED, HTTP_400_BAD_REQUEST)
 from oauth2_provider.models import get_application_model
 
 from badgeuser.authcode import authcode_for_accesstoken, decrypt_authcode
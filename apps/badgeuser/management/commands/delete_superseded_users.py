@@ -14,7 +14,7 @@ class Command(BaseCommand):
             datetime.datetime.now())
         )
         # All verified emails
-        cached = CachedEmailAddress.objects.filter(verified=True)
+        cached = CachedEmailAddress.objects.filter(verified=True).select_related('user')
 
         chunk_size = 1000
         start_index = 0
@@ -1,6 +1,4 @@
 import base64
-import random
-import string
 from hashlib import md5
 
 from allauth.account.adapter import get_adapter
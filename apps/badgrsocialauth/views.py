@@ -298,7 +298,7 @@ class SamlProvisionRedirect(RedirectView):
         except (TypeError, ValueError, AttributeError, KeyError, Saml2Configuration.DoesNotExist,):
             return saml2_fail(authError="Could not process Saml2 Response.")
 
-        if CachedEmailAddress.cached.filter(email__in=emails).count() > 0:
+        if CachedEmailAddress.cached.filter(email__in=emails).exists():
             return saml2_fail(authError="Saml2 Response Processing interrupted. Email exists.")
 
         if accesstoken is not None and not accesstoken.is_expired():
@@ -408,7 +408,7 @@ def auto_provision(request, emails, first_name, last_name, config):
         ))
 
     if saml2_account:
-        if CachedEmailAddress.objects.exclude(user=saml2_account.user).filter(email__in=emails).count() > 0:
+        if CachedEmailAddress.objects.exclude(user=saml2_account.user).filter(email__in=emails).exists():
             return redirect(reverse(
                 'saml2_failure',
                 kwargs=dict(authError="Multiple accounts using provided emails.")
@@ -422,7 +422,7 @@ def auto_provision(request, emails, first_name, last_name, config):
 
     # Check if any/all of the claimed emails already exist as verified
     claimed_emails = CachedEmailAddress.cached.filter(email__in=emails, verified=True)
-    if claimed_emails.count() > 0:
+    if claimed_emails.exists():
         # If at least one is already verified, grab the first one and redirect with error
         email = claimed_emails.first().email
         return redirect(
@@ -236,8 +236,7 @@ class BadgeInstanceAdmin(DjangoObjectActions, ModelAdmin):
     redirect_issuer.short_description = "See this Issuer"
 
     def resend_notifications(self, request, queryset):
-        ids_dict = queryset.only('entity_id').values()
-        ids = [i['entity_id'] for i in ids_dict]
+        ids = list(queryset.values_list('entity_id', flat=True))
         resend_notifications.delay(ids)
 
     def save_model(self, request, obj, form, change):
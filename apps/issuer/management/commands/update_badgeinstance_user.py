@@ -13,27 +13,30 @@ class Command(BaseCommand):
         self.stdout.write("Updating BadgeInstaces...")
         self.stdout.write("1. Setting users from verified CachedEmailAddress")
         for verified_id in CachedEmailAddress.objects.filter(verified=True):
-            self.update(verified_id.user, verified_id.email)
+            self.update(verified_id.user_id, verified_id.email)
 
         self.stdout.write("2. Setting users from verified UserRecipientIdentifier")
         for verified_id in UserRecipientIdentifier.objects.filter(verified=True):
-            self.update(verified_id.user, verified_id.identifier)
+            self.update(verified_id.user_id, verified_id.identifier)
 
         # Trigger cache updates
         chunk_size = 500
-        page = 0
+        processed = 0
+        last_pk = 0
 
         self.stdout.write("3. Triggering cache updates")
         while True:
-            badges = BadgeInstance.objects.filter(user__isnull=False)[page:page + chunk_size]
-            self.stdout.write("Processing badges %d through %d" % (page + 1, page + len(badges)))
+            # page by primary key so each chunk is an index range scan rather than an ever-growing OFFSET
+            badges = list(BadgeInstance.objects.filter(user__isnull=False, pk__gt=last_pk).order_by('pk')[:chunk_size])
+            self.stdout.write("Processing badges %d through %d" % (processed + 1, processed + len(badges)))
             for b in badges:
                 b.publish()
             if len(badges) < chunk_size:
                 break
-            page = page + chunk_size
+            processed += len(badges)
+            last_pk = badges[-1].pk
 
         self.stdout.write("All done.")
 
-    def update(self, user, identifier):
-        BadgeInstance.objects.filter(recipient_identifier=identifier).update(user=user)
+    def update(self, user_id, identifier):
+        BadgeInstance.objects.filter(recipient_identifier=identifier).update(user_id=user_id)
@@ -23,7 +23,7 @@ class Command(BaseCommand):
     def check_jsons(self, model_cls):
         mismatch = 0
         correct = 0
-        for obj in model_cls.objects.all():
+        for obj in model_cls.objects.iterator(chunk_size=500):
             new_json = obj.get_json()
             orig_json = obj.old_json
             if new_json != orig_json:
@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-16 23:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issuer', '0065_badgeclass_imageframe'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='badgeinstance',
+            index_together={('badgeclass', 'revoked', 'created_at'), ('issuer', 'revoked', 'created_at'), ('recipient_identifier', 'badgeclass', 'revoked')},
+        ),
+    ]
@@ -976,6 +976,9 @@ class BadgeInstance(BaseAuditedModel,
     class Meta:
         index_together = (
                 ('recipient_identifier', 'badgeclass', 'revoked'),
+                # paginated assertion lists filter on issuer/badgeclass and revoked, ordered by -created_at
+                ('issuer', 'revoked', 'created_at'),
+                ('badgeclass', 'revoked', 'created_at'),
         )
 
     @property
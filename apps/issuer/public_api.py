@@ -470,7 +470,7 @@ class BackpackCollectionJson(JSONComponentView):
     def get_context_data(self, **kwargs):
         image_url = ''
         if self.current_object.cached_badgeinstances().exists():
-            chosen_assertion = sorted(self.current_object.cached_badgeinstances(), key=lambda b: b.issued_on)[0]
+            chosen_assertion = min(self.current_object.cached_badgeinstances(), key=lambda b: b.issued_on)
             image_url = "{}{}?type=png".format(
                 OriginSetting.HTTP,
                 reverse('badgeinstance_image', kwargs={'entity_id': chosen_assertion.entity_id})
@@ -9,7 +9,7 @@ import logging
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.urls import reverse
 from django.core.validators import EmailValidator, URLValidator
-from django.db.models import Q
+from django.db.models import Count, Manager, Q
 from django.utils.html import strip_tags
 from django.utils import timezone
 from rest_framework import serializers
@@ -240,6 +240,22 @@ class BadgeClassExpirationSerializerV1(serializers.Serializer):
                                        choices=BadgeClass.EXPIRES_DURATION_CHOICES)
 
 
+class BadgeClassListSerializerV1(serializers.ListSerializer):
+    """
+    Counts the recipients of every badgeclass in the list with a single grouped query,
+    instead of one COUNT per badgeclass in BadgeClassSerializerV1.get_recipient_count()
+    """
+    recipient_counts = None
+
+    def to_representation(self, data):
+        badgeclasses = list(data.all() if isinstance(data, Manager) else data)
+        self.recipient_counts = dict(
+            BadgeInstance.objects.filter(badgeclass__in=badgeclasses, revoked=False)
+            .order_by().values_list('badgeclass_id').annotate(Count('id'))
+        )
+        return super(BadgeClassListSerializerV1, self).to_representation(badgeclasses)
+
+
 class BadgeClassSerializerV1(OriginalJsonSerializerMixin, ExtensionsSaverMixin, serializers.Serializer):
     created_at = DateTimeWithUtcZAtEndField(read_only=True)
     updated_at = DateTimeWithUtcZAtEndField(read_only=True)
@@ -252,7 +268,7 @@ class BadgeClassSerializerV1(OriginalJsonSerializerMixin, ExtensionsSaverMixin,
     criteria = MarkdownCharField(allow_blank=True, required=False, write_only=True)
     criteria_text = MarkdownCharField(required=False, allow_null=True, allow_blank=True)
     criteria_url = StripTagsCharField(required=False, allow_blank=True, allow_null=True, validators=[URLValidator()])
-    recipient_count = serializers.IntegerField(required=False, read_only=True, source='v1_api_recipient_count')
+    recipient_count = serializers.SerializerMethodField()
     description = StripTagsCharField(max_length=16384, required=True, convert_null=True)
 
     alignment = AlignmentItemSerializerV1(many=True, source='alignment_items', required=False)
@@ -265,8 +281,15 @@ class BadgeClassSerializerV1(OriginalJsonSerializerMixin, ExtensionsSaverMixin,
     source_url = serializers.CharField(max_length=255, required=False, allow_blank=True, allow_null=True)
 
     class Meta:
+        list_serializer_class = BadgeClassListSerializerV1
         apispec_definition = ('BadgeClass', {})
 
+    def get_recipient_count(self, obj):
+        recipient_counts = getattr(self.parent, 'recipient_counts', None)
+        if recipient_counts is not None:
+            return recipient_counts.get(obj.pk, 0)
+        return obj.v1_api_recipient_count
+
     def to_internal_value(self, data):
         if 'expires' in data:
             if not data['expires'] or len(data['expires']) == 0:
@@ -319,12 +342,13 @@ class BadgeClassSerializerV1(OriginalJsonSerializerMixin, ExtensionsSaverMixin,
         return extensions
 
     def add_extensions(self, instance, add_these_extensions, extension_items):
-        for extension_name in add_these_extensions:
-            original_json = extension_items[extension_name]
-            extension = BadgeClassExtension(name=extension_name,
-                                            original_json=json.dumps(original_json),
-                                            badgeclass_id=instance.pk)
-            extension.save()
+        # insert all new extensions at once; the caller saves (and so publishes) the badgeclass afterwards
+        BadgeClassExtension.objects.bulk_create([
+            BadgeClassExtension(name=extension_name,
+                                original_json=json.dumps(extension_items[extension_name]),
+                                badgeclass_id=instance.pk)
+            for extension_name in add_these_extensions
+        ])
 
     def update(self, instance, validated_data):
         logger.info("UPDATE BADGECLASS")
@@ -2,12 +2,10 @@
 import os
 
 import dateutil
-import requests
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.db.models.signals import post_save
-from requests import ConnectionError
 
 import badgrlog
 from issuer.helpers import BadgeCheckHelper
@@ -3,6 +3,7 @@
 
 import base64
 import json
+import mock
 from urllib.parse import quote_plus
 
 from django.core.files.images import get_image_dimensions
@@ -443,6 +444,39 @@ class BadgeClassTests(SetupIssuerHelper, BadgrTestCase):
         self.assertIsInstance(response.data, list)
         self.assertEqual(len(response.data), len(test_badgeclasses))
 
+    @mock.patch('issuer.models.BadgeInstance.notify_earner', new=lambda *args, **kwargs: None)
+    def test_badgeclass_list_includes_recipient_counts(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user, verified=True)
+        awarded_badgeclass, unawarded_badgeclass = list(self.setup_badgeclasses(issuer=test_issuer, how_many=2))
+        awarded_badgeclass.issue(recipient_id='first.recipient@email.test')
+        awarded_badgeclass.issue(recipient_id='second.recipient@email.test')
+        revoked_assertion = awarded_badgeclass.issue(recipient_id='third.recipient@email.test')
+        revoked_assertion.revoked = True
+        revoked_assertion.save()
+
+        response = self.client.get('/v1/issuer/issuers/{slug}/badges'.format(slug=test_issuer.entity_id))
+        self.assertEqual(response.status_code, 200)
+        recipient_counts = {b['slug']: b['recipient_count'] for b in response.data}
+        self.assertEqual(recipient_counts[awarded_badgeclass.entity_id], 2)
+        self.assertEqual(recipient_counts[unawarded_badgeclass.entity_id], 0)
+
+    @mock.patch('issuer.models.BadgeInstance.notify_earner', new=lambda *args, **kwargs: None)
+    def test_badgeclass_list_recipient_counts_do_not_scale_with_badgeclasses(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user, verified=True)
+        for badgeclass in self.setup_badgeclasses(issuer=test_issuer, how_many=3):
+            badgeclass.issue(recipient_id='new.recipient@email.test')
+
+        url = '/v1/issuer/issuers/{slug}/badges'.format(slug=test_issuer.entity_id)
+        response = self.client.get(url)  # warm the cache
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertNumQueries(1):  # a single grouped query for every recipient_count
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual([b['recipient_count'] for b in response.data], [1, 1, 1])
+
     def test_cannot_get_badgeclass_list_if_unauthenticated(self):
         """
         Ensure that logged-out user can't GET the private API endpoint for badgeclass list
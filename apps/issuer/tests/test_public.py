@@ -12,12 +12,11 @@ import responses
 
 from django.core.files.base import ContentFile
 from django.urls import reverse
-from openbadges.verifier.openbadges_context import OPENBADGES_CONTEXT_V1_URI, OPENBADGES_CONTEXT_V2_URI, \
-    OPENBADGES_CONTEXT_V2_DICT
+from openbadges.verifier.openbadges_context import OPENBADGES_CONTEXT_V1_URI, OPENBADGES_CONTEXT_V2_URI
 from openbadges_bakery import unbake
 
 from backpack.models import BackpackCollection, BackpackCollectionBadgeInstance
-from backpack.tests.utils import setup_resources, setup_basic_1_0, CURRENT_DIRECTORY
+from backpack.tests.utils import setup_resources, setup_basic_1_0, CURRENT_DIRECTORY, OPENBADGES_CONTEXT_V2_JSON
 from badgeuser.models import CachedEmailAddress
 from issuer.models import BadgeClass, BadgeInstance, Issuer
 from issuer.utils import OBI_VERSION_CONTEXT_IRIS, UNVERSIONED_BAKED_VERSION
@@ -297,7 +296,7 @@ class PublicAPITests(SetupIssuerHelper, BadgrTestCase):
         setup_basic_1_0()
         setup_resources([
             {'url': OPENBADGES_CONTEXT_V1_URI, 'filename': 'v1_context.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)}
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON}
         ])
         self.setup_user(email='test@example.com', authenticate=True)
 
@@ -385,7 +384,7 @@ class PendingAssertionsPublicAPITests(SetupIssuerHelper, BadgrTestCase):
     def test_pending_assertion_returns_404(self):
         setup_resources([
             {'url': 'http://a.com/assertion-embedded1', 'filename': '2_0_assertion_embedded_badgeclass.json'},
-            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': json.dumps(OPENBADGES_CONTEXT_V2_DICT)},
+            {'url': OPENBADGES_CONTEXT_V2_URI, 'response_body': OPENBADGES_CONTEXT_V2_JSON},
             {'url': 'http://a.com/badgeclass_image', 'filename': "unbaked_image.png", 'mode': 'rb'},
         ])
         unverified_email = 'test@example.com'
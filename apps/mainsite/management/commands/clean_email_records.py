@@ -24,7 +24,7 @@ class Command(BaseCommand):
                 emails = CachedEmailAddress.objects.filter(user=user)
 
                 # handle users who don't have an EmailAddress record
-                if emails.count() < 1 and user.email:
+                if not emails and user.email:
                     try:
                         CachedEmailAddress.objects.get(email=user.email)
                     except CachedEmailAddress.DoesNotExist:
@@ -42,7 +42,7 @@ class Command(BaseCommand):
                     emails = CachedEmailAddress.objects.filter(user=user)
 
                 # User has emails but none marked primary
-                elif len([e for e in emails if e.primary is True]) == 0:
+                elif not any(e.primary for e in emails):
                     new_primary = emails.first()
                     new_primary.set_as_primary(conditional=True)
                     self.stdout.write("Set {} as primary for user {}".format(new_primary.email, user.pk))
@@ -17,12 +17,12 @@ class Command(BaseCommand):
         self.stdout.write('Bulk creating AccessTokenScope')
         while True:
             tokens = AccessTokenProxy.objects.filter(expires__gt=timezone.now())[page:page + chunk_size]
+            scopes = []
             for t in tokens:
-                scopes = []
                 for s in t.scope.split():
                     scopes.append(AccessTokenScope(scope=s, token=t))
 
-                AccessTokenScope.objects.bulk_create(scopes)
+            AccessTokenScope.objects.bulk_create(scopes)
             if len(tokens) < chunk_size:
                 break
             page += chunk_size
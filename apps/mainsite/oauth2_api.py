@@ -1,7 +1,6 @@
 # encoding: utf-8
 
 import base64
-from typing import Any, Dict
 import requests
 import json
 import re
@@ -17,14 +16,13 @@ from django.http import HttpResponse
 from django.utils import timezone
 from django.contrib.auth import logout
 from oauth2_provider.exceptions import OAuthToolkitError
-from oauth2_provider.models import get_application_model, get_access_token_model, Application, RefreshToken, AccessToken
+from oauth2_provider.models import get_application_model, get_access_token_model, Application
 from oauth2_provider.scopes import get_scopes_backend
 from oauth2_provider.settings import oauth2_settings
 from oauth2_provider.views import TokenView as OAuth2ProviderTokenView
 from oauth2_provider.views.mixins import OAuthLibMixin
 from oauth2_provider.signals import app_authorized
 from oauthlib.oauth2.rfc6749.utils import scope_to_list
-from oauthlib.oauth2.rfc6749.tokens import random_token_generator
 from rest_framework import serializers, permissions
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST, HTTP_401_UNAUTHORIZED
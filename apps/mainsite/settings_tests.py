@@ -20,6 +20,11 @@ DATABASES = {
     }
 }
 
+# django test speedups
+PASSWORD_HASHERS = (
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+)
+
 CELERY_ALWAYS_EAGER = True
 SECRET_KEY = 'aninsecurekeyusedfortesting'
 UNSUBSCRIBE_SECRET_KEY = str(SECRET_KEY)
@@ -7,7 +7,7 @@ import random
 import time
 
 from django.core.cache import cache
-from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
 from django.test import override_settings, TransactionTestCase
 from django.utils import timezone
 from oauth2_provider.models import Application
@@ -83,13 +83,12 @@ class SetupUserHelper(object):
             # ensure there are terms and the user agrees to them to ensure there are no cache misses during tests
             terms, created = TermsVersion.objects.get_or_create(version=terms_version)
             user.agreed_terms_version = terms_version
-            user.save()
 
+        if password is not None:
+            user.set_password(password)
+        user.save()
         if password is None:
             user.password = None
-        else:
-            user.set_password(password)
-            user.save()
         if create_email_address:
             email = user.cached_emails()[0]
             email.verified = verified
@@ -115,10 +114,11 @@ class SetupIssuerHelper(object):
     def setup_issuer(self,
                      name='Test Issuer',
                      description='test case Issuer',
-                     owner=None):
+                     owner=None,
+                     verified=False):
         issuer = Issuer.objects.create(
             name=name, description=description, created_by=owner, email=owner.email,
-            url='http://example.com'
+            url='http://example.com', verified=verified
         )
         return issuer
 
@@ -184,18 +184,22 @@ class SetupIssuerHelper(object):
             yield self.setup_badgeclass(**kwargs)
 
 
+# an in-process cache avoids a file read or write on every cached model lookup
+TEST_CACHE_LOCATION = 'badgr-test-cache'
+
+
 @override_settings(
     CACHES={
         'default': {
-            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
-            'LOCATION': os.path.join(TOP_DIR, 'test.cache'),
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': TEST_CACHE_LOCATION,
         }
     },
 )
 class CachingTestCase(TransactionTestCase):
     @classmethod
     def tearDownClass(cls):
-        test_cache = FileBasedCache(os.path.join(TOP_DIR, 'test.cache'), {})
+        test_cache = LocMemCache(TEST_CACHE_LOCATION, {})
         test_cache.clear()
 
     def setUp(self):
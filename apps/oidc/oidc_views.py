@@ -1,4 +1,3 @@
-from django.shortcuts import render
 from django.conf import settings
 from django.shortcuts import redirect
 from django.http import JsonResponse